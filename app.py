@@ -1,19 +1,47 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request
 import tempfile
 import os
 import logging
+import logging.handlers
+import queue
+import atexit
 
-from code_analyzer import CodeAnalyzer
+import orjson
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from code_analyzer import CodeAnalyzer, AnalysisBatcher, Issue
+
+# Longest accepted snippet, in characters
+MAX_CODE_CHARS = 100_000
+# Upper bound on the raw request body. In JSON, one character takes at most 12 bytes
+# (an astral character escaped as a \uXXXX\uXXXX surrogate pair); the extra 1KB
+# leaves room for the rest of the payload.
+MAX_REQUEST_BYTES = MAX_CODE_CHARS * 12 + 1024
+
+# Configure logging before the analyzer logs tool availability. Request threads
+# only enqueue records; a listener thread does the file writes.
+log_queue = queue.Queue(-1)
+file_handler = logging.FileHandler('code_analyzer.log')
+file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+logging.getLogger().setLevel(logging.INFO)
 
 app = Flask(__name__)
+app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_BYTES
 analyzer = CodeAnalyzer()
+batcher = AnalysisBatcher(analyzer)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    filename='code_analyzer.log',
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+def _encode_issue(obj):
+    if isinstance(obj, Issue):
+        return obj.asdict()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+def json_response(payload, status=200):
+    """Serialize payload with orjson, which returns bytes ready for the response body"""
+    return Response(orjson.dumps(payload, default=_encode_issue), status=status, mimetype='application/json')
 
 @app.route('/')
 def index():
@@ -21,41 +49,51 @@ def index():
 
 @app.route('/analyze', methods=['POST'])
 def analyze_code():
+    # Reject oversized bodies from the header alone, before reading or parsing them
+    content_length = request.content_length
+    if content_length and content_length > MAX_REQUEST_BYTES:
+        logging.warning("Request body exceeded limit")
+        return json_response({'success': False, 'error': 'Request too large'}, 413)
+
     try:
-        data = request.get_json()
+        data = orjson.loads(request.get_data(cache=False))
         code = data.get('code', '')
         language = data.get('language', 'python').lower()
         
         # Input validation
         if not code.strip():
             logging.warning("Empty code submitted")
-            return jsonify({'success': False, 'error': 'No code provided'}), 400
-        if len(code) > 100000:  # Limit to 100KB
+            return json_response({'success': False, 'error': 'No code provided'}, 400)
+        if len(code) > MAX_CODE_CHARS:
             logging.warning("Code size exceeded limit")
-            return jsonify({'success': False, 'error': 'Code size exceeds 100KB limit'}), 400
+            return json_response({'success': False, 'error': f'Code size exceeds {MAX_CODE_CHARS:,} character limit'}, 400)
         if language not in ['python', 'javascript']:
             logging.warning(f"Unsupported language: {language}")
-            return jsonify({'success': False, 'error': f'Unsupported language: {language}'}), 400
+            return json_response({'success': False, 'error': f'Unsupported language: {language}'}, 400)
         
         # Analyze code
-        results = analyzer.analyze(code, language)
+        results = batcher.analyze(code, language)
         
         if 'error' in results:
             logging.error(f"Analysis failed: {results['error']}")
-            return jsonify({'success': False, 'error': results['error']}), 500
+            return json_response({'success': False, 'error': results['error']}, 500)
         
         logging.info(f"Analysis completed: {results['summary']}")
-        return jsonify({
+        return json_response({
             'success': True,
             'results': results
         })
     
+    except RequestEntityTooLarge:
+        # Bodies without a Content-Length are cut off by Werkzeug while reading
+        logging.warning("Request body exceeded limit")
+        return json_response({'success': False, 'error': 'Request too large'}, 413)
     except Exception as e:
         logging.error(f"Server error during analysis: {str(e)}")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': f'Server error: {str(e)}'
-        }), 500
+        }, 500)
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=int(os.getenv('PORT', 5000)))
\ No newline at end of file
+    app.run(debug=True, threaded=True, host='0.0.0.0', port=int(os.getenv('PORT', 5000)))
\ No newline at end of file
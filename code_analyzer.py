@@ -1,270 +1,573 @@
 import tempfile
+import bisect
 import os
 import subprocess
 import json
 import re
 import shutil
+import sys
 import logging
-from typing import Dict, List, Any
+import hashlib
+import importlib.util
+import threading
+import uuid
+import queue
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+
+import orjson
+
+from pylint_worker import read_frame, write_frame
+from result_cache import TinyLFUCache
+
+# Display name for a Python snippet fed to the linters on stdin
+STDIN_PYTHON_NAME = 'stdin.py'
+PYLINT_WORKER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pylint_worker.py')
+PYLINT_WORKER_MAX_REQUESTS = 500
+# Most pylint processes running at once; each lints one snippet at a time on one core
+PYLINT_WORKER_COUNT = os.cpu_count() or 2
+# Batches larger than this are split across several concurrent linter runs
+BATCH_MAX_FILES_PER_RUN = 8
+
+# Regex fallback for JavaScript when ESLint is unavailable.
+# Lines starting with these don't need a trailing semicolon
+_JS_BLOCK_KEYWORDS = ('if', 'for', 'while', 'function', 'else', 'try', 'catch', 'finally')
+# (check name, literal every match contains, pattern). Each pattern is scanned over
+# the whole source at once; [^\S\n] keeps each match on a single line. They are kept
+# separate rather than fused into one alternation: re can then jump between
+# occurrences of each literal prefix, while an alternation tries every branch at
+# every position.
+_JS_PATTERNS = (
+    ('var', 'var', re.compile(r'\bvar[^\S\n]+')),
+    ('console_log', 'console.log', re.compile(r'console\.log')),
+    ('loose_eq', '==', re.compile(r'==(?!=)')),
+    ('anon_func', 'function', re.compile(r'function[^\S\n]*\([^\S\n]*\)')),
+)
+_NEWLINE = re.compile(r'\n')
+# One flake8 finding in our --format. The path is matched lazily up to the first ":row:col:CODE:",
+# since it may itself contain colons (a Windows drive letter).
+_FLAKE8_LINE = re.compile(r'(.+?):(\d+):(\d+):([A-Z]\w*):(.*)')
+# Seconds one flake8 run may take
+FLAKE8_TIMEOUT = 30
+# Fallback check name -> (result bucket, message, issue type), in report order
+_JS_FINDINGS = {
+    'missing_semicolon': ('suggestions', 'Consider adding semicolon at end of statement', 'style'),
+    'var': ('suggestions', 'Consider using let or const instead of var', 'modern'),
+    'console_log': ('warnings', 'Remove console.log statements in production code', 'warning'),
+    'loose_eq': ('suggestions', 'Use strict equality (===) instead of loose equality (==)', 'best_practice'),
+    'anon_func': ('suggestions', 'Consider using arrow functions for better readability', 'modern'),
+}
+
+def _error_result(message: str) -> Dict[str, Any]:
+    """Build a result carrying an error and no findings"""
+    return {'bugs': [], 'warnings': [], 'suggestions': [], 'error': message}
+
+def _analysis_result(bugs: List, warnings: List, suggestions: List) -> Dict[str, Any]:
+    """Build a successful result with its summary line"""
+    return {
+        'bugs': bugs,
+        'warnings': warnings,
+        'suggestions': suggestions,
+        'summary': f'Found {len(bugs)} bugs, {len(warnings)} warnings, {len(suggestions)} suggestions'
+    }
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a result's issue lists; the Issues themselves are immutable and can be shared"""
+    return {key: list(value) if isinstance(value, list) else value for key, value in result.items()}
+
+# Default for Issue fields the reporting linter doesn't provide. A field the linter
+# reports as null (e.g. an ESLint message without a ruleId) stays None and is kept.
+_NOT_REPORTED: Any = object()
+
+class Issue(NamedTuple):
+    """A single, immutable linter finding; a tuple is much smaller than an equivalent dict"""
+
+    line: int
+    message: str
+    type: str
+    column: Optional[int] = _NOT_REPORTED
+    symbol: Optional[str] = _NOT_REPORTED
+    code: Optional[str] = _NOT_REPORTED
+
+    def asdict(self) -> Dict[str, Any]:
+        """Return the issue as a dict, omitting fields the reporting linter doesn't provide"""
+        # Spelled out field by field: this runs once per issue in every JSON response
+        line, message, issue_type, column, symbol, code = self
+        issue = {'line': line}
+        if column is not _NOT_REPORTED:
+            issue['column'] = column
+        issue['message'] = message
+        issue['type'] = issue_type
+        if symbol is not _NOT_REPORTED:
+            issue['symbol'] = symbol
+        if code is not _NOT_REPORTED:
+            issue['code'] = code
+        return issue
+
+class _PylintWorker:
+    """Client side of one persistent pylint_worker.py process; not thread-safe"""
+
+    def __init__(self):
+        self._process: Optional[subprocess.Popen] = None
+        self._uses = 0
+        self._restart()
+
+    def _restart(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+        self._process = subprocess.Popen(
+            [sys.executable, PYLINT_WORKER_PATH],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE
+        )
+        self._uses = 0
+
+    def lint(self, file_name: str, code: str) -> List[Dict[str, Any]]:
+        """Lint one snippet and return the parsed pylint messages"""
+        payload = orjson.dumps({'filename': file_name, 'code': code})
+        # Recycle the process periodically so astroid's caches can't grow without bound
+        if self._process.poll() is not None or self._uses >= PYLINT_WORKER_MAX_REQUESTS:
+            self._restart()
+        process = self._process
+        self._uses += 1
+
+        timed_out = threading.Event()
+
+        def kill_process():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(30, kill_process)
+        timer.start()
+        try:
+            write_frame(process.stdin, payload)
+            frame = read_frame(process.stdout)
+        except OSError:
+            frame = None
+        finally:
+            timer.cancel()
+
+        if frame is None:
+            self._restart()
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(process.args, 30)
+            raise RuntimeError('pylint worker exited unexpectedly')
+
+        response = orjson.loads(frame)
+        if isinstance(response, dict):
+            raise RuntimeError(response.get('error', 'pylint worker failed'))
+        return response
 
 class CodeAnalyzer:
     def __init__(self):
         self.python_analyzers = ['pylint', 'flake8']
-        # Check tool availability
-        for tool in self.python_analyzers:
-            if not shutil.which(tool):
+        # Check tool availability once; PATH lookups are too costly to repeat per request.
+        # pylint runs inside this interpreter (see pylint_worker.py), so it must be importable here.
+        self._has_pylint = importlib.util.find_spec('pylint') is not None
+        self._has_flake8 = shutil.which('flake8') is not None
+        self._has_eslint = shutil.which('eslint') is not None
+        for tool, available in (('pylint', self._has_pylint), ('flake8', self._has_flake8)):
+            if not available:
                 logging.error(f"{tool} is not installed. Please install it using 'pip install {tool}'.")
-        if not shutil.which('eslint'):
+        if not self._has_eslint:
             logging.warning("ESLint is not installed. JavaScript analysis will be limited.")
+        # Keep scratch files for the linters in RAM (tmpfs) when available
+        self._tmpdir = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+        # Results keyed by (language, code digest) so resubmitted snippets skip the linters
+        # TinyLFU admission keeps one-off pastes from evicting frequently resubmitted code
+        self._cache = TinyLFUCache(maxsize=1024)
+        self._cache_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='linter')
+        # JavaScript gets its own threads so it never queues behind Python linting
+        self._javascript_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='javascript')
+        # pylint jobs queue here rather than holding threads of the shared pool while they wait
+        self._pylint_pool = ThreadPoolExecutor(max_workers=PYLINT_WORKER_COUNT, thread_name_prefix='pylint')
+        # Idle persistent pylint processes, so pylint is imported once per worker, not per snippet.
+        # One starts warm up front; more are started as concurrent snippets need them.
+        self._pylint_workers: 'queue.Queue[_PylintWorker]' = queue.Queue()
+        if self._has_pylint:
+            self._pylint_workers.put(_PylintWorker())
 
     def analyze(self, code: str, language: str) -> Dict[str, Any]:
         """Analyze code and return bugs, warnings, and suggestions"""
-        language = language.lower()
-        if language == 'python':
-            return self._analyze_python(code)
-        elif language == 'javascript':
-            return self._analyze_javascript(code)
-        else:
-            logging.warning(f"Unsupported language: {language}")
-            return {
-                'bugs': [],
-                'warnings': [],
-                'suggestions': [],
-                'error': f'Language "{language}" is not supported. Supported languages: python, javascript'
-            }
+        return self.analyze_many([(code, language)])[0]
+
+    def analyze_many(self, snippets: List[Tuple[str, str]], record_lookups: bool = True) -> List[Dict[str, Any]]:
+        """Analyze (code, language) pairs, linting all uncached Python snippets in one pass
+
+        Pass record_lookups=False if the snippets were already looked up through
+        cached_result, so the cache's admission counts see each request once.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(snippets)
+        pending: Dict[tuple, List[int]] = {}
+        pending_code: Dict[tuple, str] = {}
+
+        for index, (code, language) in enumerate(snippets):
+            language = language.lower()
+            if language not in ('python', 'javascript'):
+                logging.warning(f"Unsupported language: {language}")
+                results[index] = _error_result(f'Language "{language}" is not supported. Supported languages: python, javascript')
+                continue
+
+            key = self._cache_key(code, language)
+            cached = self._cached_result(key, record_lookups)
+            if cached is not None:
+                results[index] = cached
+                continue
+            pending.setdefault(key, []).append(index)
+            pending_code[key] = code
+
+        fresh: Dict[tuple, Dict[str, Any]] = {}
+        javascript_keys = [key for key in pending if key[0] == 'javascript']
+        if len(pending) == 1 and javascript_keys:
+            # A lone JavaScript snippet has nothing to overlap with, so it runs on the caller's thread
+            fresh[javascript_keys[0]] = self._analyze_javascript(pending_code[javascript_keys[0]])
+            javascript_keys = []
+        # Otherwise JavaScript snippets run alongside each other and the Python batch
+        javascript_futures = {
+            key: self._javascript_pool.submit(self._analyze_javascript, pending_code[key])
+            for key in javascript_keys
+        }
+        python_keys = [key for key in pending if key[0] == 'python']
+        if len(python_keys) == 1:
+            fresh[python_keys[0]] = self._analyze_python(pending_code[python_keys[0]])
+        elif python_keys:
+            python_results = self._analyze_python_batch([pending_code[key] for key in python_keys])
+            fresh.update(zip(python_keys, python_results))
+        for key, future in javascript_futures.items():
+            fresh[key] = future.result()
+
+        for key, result in fresh.items():
+            # Don't cache failures; a timeout or missing tool may be transient
+            if 'error' not in result:
+                with self._cache_lock:
+                    self._cache[key] = _copy_result(result)
+            for position, index in enumerate(pending[key]):
+                results[index] = result if position == 0 else _copy_result(result)
+
+        return results
+
+    def cached_result(self, code: str, language: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached analysis of code, or None if it hasn't been analyzed"""
+        return self._cached_result(self._cache_key(code, language.lower()))
+
+    def _cached_result(self, key: tuple, record: bool = True) -> Optional[Dict[str, Any]]:
+        with self._cache_lock:
+            cached = self._cache.get(key) if record else self._cache.peek(key)
+        return _copy_result(cached) if cached is not None else None
+
+    @staticmethod
+    def _cache_key(code: str, language: str) -> tuple:
+        """Build the result cache key from the language and a digest of the code"""
+        return (language, hashlib.blake2b(code.encode('utf-8'), digest_size=16).hexdigest())
 
     def _analyze_python(self, code: str) -> Dict[str, Any]:
-        """Analyze Python code using pylint and flake8"""
-        bugs = []
-        warnings = []
-        suggestions = []
-        temp_file = None
+        """Analyze Python code using pylint and flake8, feeding the source on stdin"""
+        try:
+            # Both linters spend their time in a subprocess, so run them side by side
+            pylint_future = self._pylint_pool.submit(self._run_pylint, code)
+            flake8_future = self._pool.submit(self._run_flake8, [STDIN_PYTHON_NAME], stdin=code)
+            pylint_result, flake8_results = pylint_future.result(), flake8_future.result()
+        except Exception as e:
+            logging.error(f"Python analysis failed: {str(e)}")
+            return _error_result(f'Python analysis failed: {str(e)}')
+
+        return self._combine_python_results(pylint_result, flake8_results[STDIN_PYTHON_NAME])
 
+    def _analyze_python_batch(self, codes: List[str]) -> List[Dict[str, Any]]:
+        """Analyze several Python snippets: pylint per snippet on the warm workers, flake8 once per group of files"""
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(code)
-                temp_file = f.name
-
-            # Run pylint
-            pylint_results = self._run_pylint(temp_file)
-            if 'error' in pylint_results:
-                return pylint_results
-            bugs.extend(pylint_results['bugs'])
-            warnings.extend(pylint_results['warnings'])
-            suggestions.extend(pylint_results['suggestions'])
-
-            # Run flake8
-            flake8_results = self._run_flake8(temp_file)
-            if 'error' in flake8_results:
-                return flake8_results
-            bugs.extend(flake8_results['bugs'])
-            warnings.extend(flake8_results['warnings'])
+            with tempfile.TemporaryDirectory(dir=self._tmpdir) as temp_dir:
+                # Absolute paths let flake8 run from the app's directory, so it honours the
+                # same config files as for a single snippet on stdin
+                file_names = [os.path.join(temp_dir, f'snip_{uuid.uuid4().hex}.py') for _ in codes]
+                for file_name, code in zip(file_names, codes):
+                    with open(file_name, 'w') as f:
+                        f.write(code)
+
+                # Large batches are split across runs. Dealing snippets largest-first,
+                # round-robin, gives each run a similar amount of code to lint.
+                run_count = -(-len(codes) // BATCH_MAX_FILES_PER_RUN)
+                by_size = sorted(range(len(codes)), key=lambda index: len(codes[index]), reverse=True)
+                groups = [[file_names[index] for index in by_size[start::run_count]] for start in range(run_count)]
 
+                # pylint snippets go largest-first so the longest ones don't finish the batch last
+                flake8_futures = [self._pool.submit(self._run_flake8, group) for group in groups]
+                pylint_futures = {index: self._pylint_pool.submit(self._run_pylint, codes[index]) for index in by_size}
+                flake8_results = {}
+                for future in flake8_futures:
+                    flake8_results.update(future.result())
+                pylint_results = [pylint_futures[index].result() for index in range(len(codes))]
         except Exception as e:
             logging.error(f"Python analysis failed: {str(e)}")
-            return {
-                'bugs': [],
-                'warnings': [],
-                'suggestions': [],
-                'error': f'Python analysis failed: {str(e)}'
-            }
-        finally:
-            if temp_file and os.path.exists(temp_file):
-                try:
-                    os.unlink(temp_file)
-                except OSError as e:
-                    logging.error(f"Failed to delete temporary file {temp_file}: {str(e)}")
-
-        return {
-            'bugs': bugs,
-            'warnings': warnings,
-            'suggestions': suggestions,
-            'summary': f'Found {len(bugs)} bugs, {len(warnings)} warnings, {len(suggestions)} suggestions'
-        }
+            return [_error_result(f'Python analysis failed: {str(e)}') for _ in codes]
 
-    def _run_pylint(self, file_path: str) -> Dict[str, List]:
-        """Run pylint and parse results"""
-        bugs = []
-        warnings = []
-        suggestions = []
+        return [
+            self._combine_python_results(pylint_result, flake8_results[file_name])
+            for pylint_result, file_name in zip(pylint_results, file_names)
+        ]
+
+    @staticmethod
+    def _combine_python_results(pylint_result: Dict[str, List], flake8_result: Dict[str, List]) -> Dict[str, Any]:
+        """Merge one snippet's pylint and flake8 results, surfacing the first error"""
+        if 'error' in pylint_result:
+            return pylint_result
+        if 'error' in flake8_result:
+            return flake8_result
 
-        if not shutil.which('pylint'):
+        bugs = pylint_result['bugs'] + flake8_result['bugs']
+        warnings = pylint_result['warnings'] + flake8_result['warnings']
+        suggestions = pylint_result['suggestions']
+        return _analysis_result(bugs, warnings, suggestions)
+
+    def _run_pylint(self, code: str) -> Dict[str, List]:
+        """Lint one snippet on a warm pylint worker and sort its messages into result buckets"""
+        results = {'bugs': [], 'warnings': [], 'suggestions': []}
+
+        if not self._has_pylint:
             logging.error("pylint not found")
-            return {'bugs': [], 'warnings': [], 'suggestions': [], 'error': 'pylint not installed. Install using "pip install pylint".'}
+            return _error_result('pylint not installed. Install using "pip install pylint".')
 
         try:
-            result = subprocess.run(
-                ['pylint', '--output-format=json', file_path],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.stdout:
-                pylint_output = json.loads(result.stdout)
-                for issue in pylint_output:
-                    item = {
-                        'line': issue.get('line', 0),
-                        'column': issue.get('column', 0),
-                        'message': issue.get('message', ''),
-                        'type': issue.get('type', ''),
-                        'symbol': issue.get('symbol', '')
-                    }
-                    if issue.get('type') == 'error':
-                        bugs.append(item)
-                    elif issue.get('type') == 'warning':
-                        warnings.append(item)
-                    elif issue.get('type') in ['convention', 'refactor']:
-                        suggestions.append(item)
-            else:
-                logging.error(f"pylint failed with stderr: {result.stderr}")
-                return {'bugs': [], 'warnings': [], 'suggestions': [], 'error': f'pylint failed: {result.stderr}'}
+            for issue in self._lint_with_worker(STDIN_PYTHON_NAME, code):
+                item = Issue(
+                    line=issue.get('line', 0),
+                    column=issue.get('column', 0),
+                    message=issue.get('message', ''),
+                    type=issue.get('type', ''),
+                    symbol=issue.get('symbol', '')
+                )
+                if issue.get('type') == 'error':
+                    results['bugs'].append(item)
+                elif issue.get('type') == 'warning':
+                    results['warnings'].append(item)
+                elif issue.get('type') in ['convention', 'refactor']:
+                    results['suggestions'].append(item)
 
         except subprocess.TimeoutExpired:
             logging.error("pylint timed out after 30 seconds")
-            return {'bugs': [], 'warnings': [], 'suggestions': [], 'error': 'pylint analysis timed out'}
+            return _error_result('pylint analysis timed out')
         except json.JSONDecodeError as e:
             logging.error(f"pylint JSON parsing failed: {str(e)}")
-            return {'bugs': [], 'warnings': [], 'suggestions': [], 'error': 'Failed to parse pylint output'}
+            return _error_result('Failed to parse pylint output')
         except Exception as e:
             logging.error(f"pylint error: {str(e)}")
-            return {'bugs': [], 'warnings': [], 'suggestions': [], 'error': f'pylint error: {str(e)}'}
+            return _error_result(f'pylint error: {str(e)}')
 
-        return {'bugs': bugs, 'warnings': warnings, 'suggestions': suggestions}
+        return results
 
-    def _run_flake8(self, file_path: str) -> Dict[str, List]:
-        """Run flake8 and parse results"""
-        bugs = []
-        warnings = []
+    def _lint_with_worker(self, file_name: str, code: str) -> List[Dict[str, Any]]:
+        """Lint one snippet on an idle pylint worker; call only from _pylint_pool"""
+        try:
+            worker = self._pylint_workers.get_nowait()
+        except queue.Empty:
+            # All workers are busy. _pylint_pool has one thread per allowed worker, so this never
+            # starts more than PYLINT_WORKER_COUNT of them.
+            worker = _PylintWorker()
+        try:
+            return worker.lint(file_name, code)
+        finally:
+            self._pylint_workers.put(worker)
+
+    def _run_flake8(self, file_names: List[str], stdin: Optional[str] = None,
+                    timeout: float = FLAKE8_TIMEOUT) -> Dict[str, Dict[str, List]]:
+        """Run flake8 once over files (or one snippet on stdin) and parse results per file name"""
+        results = {name: {'bugs': [], 'warnings': []} for name in file_names}
 
-        if not shutil.which('flake8'):
+        if not self._has_flake8:
             logging.error("flake8 not found")
-            return {'bugs': [], 'warnings': [], 'suggestions': [], 'error': 'flake8 not installed. Install using "pip install flake8".'}
+            return {name: _error_result('flake8 not installed. Install using "pip install flake8".') for name in file_names}
 
         try:
+            targets = [f'--stdin-display-name={file_names[0]}', '-'] if stdin is not None else file_names
             result = subprocess.run(
-                ['flake8', '--format=%(row)d:%(col)d:%(code)s:%(text)s', file_path],
+                ['flake8', '--format=%(path)s:%(row)d:%(col)d:%(code)s:%(text)s', *targets],
+                input=stdin,
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=timeout
             )
             for line in result.stdout.strip().split('\n'):
-                if line:
-                    parts = line.split(':', 3)
-                    if len(parts) >= 4:
-                        item = {
-                            'line': int(parts[0]),
-                            'column': int(parts[1]),
-                            'code': parts[2],
-                            'message': parts[3],
-                            'type': 'style'
-                        }
-                        if parts[2].startswith('E'):
-                            bugs.append(item)
-                        else:
-                            warnings.append(item)
+                match = _FLAKE8_LINE.match(line)
+                if match:
+                    path, row, col, code, text = match.groups()
+                    file_result = results.get(path)
+                    if file_result is None:
+                        continue
+                    item = Issue(
+                        line=int(row),
+                        column=int(col),
+                        code=code,
+                        message=text,
+                        type='style'
+                    )
+                    if code.startswith('E'):
+                        file_result['bugs'].append(item)
+                    else:
+                        file_result['warnings'].append(item)
         except subprocess.TimeoutExpired:
+            if len(file_names) > 1:
+                # Retry one file at a time so a single slow snippet doesn't fail its whole group.
+                # The retries share one more timeout, so a request waits at most twice as long.
+                logging.warning(f"flake8 timed out on a group of {len(file_names)} files, retrying each file separately")
+                deadline = time.monotonic() + FLAKE8_TIMEOUT
+                results = {}
+                for name in file_names:
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        results.update(self._run_flake8([name], timeout=remaining))
+                    else:
+                        results[name] = _error_result('flake8 analysis timed out')
+                return results
             logging.error("flake8 timed out after 30 seconds")
-            return {'bugs': [], 'warnings': [], 'suggestions': [], 'error': 'flake8 analysis timed out'}
+            return {name: _error_result('flake8 analysis timed out') for name in file_names}
         except Exception as e:
             logging.error(f"flake8 error: {str(e)}")
-            return {'bugs': [], 'warnings': [], 'suggestions': [], 'error': f'flake8 error: {str(e)}'}
+            return {name: _error_result(f'flake8 error: {str(e)}') for name in file_names}
 
-        return {'bugs': bugs, 'warnings': warnings}
+        return results
 
     def _analyze_javascript(self, code: str) -> Dict[str, Any]:
         """Analyze JavaScript code using ESLint or fallback to regex"""
         bugs = []
         warnings = []
         suggestions = []
-        temp_file = None
 
-        if shutil.which('eslint'):
+        if self._has_eslint:
             try:
-                # Create temporary file
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
-                    f.write(code)
-                    temp_file = f.name
-
-                # Run ESLint
+                # Run ESLint on stdin
                 result = subprocess.run(
-                    ['eslint', '--format=json', temp_file],
+                    ['eslint', '--format=json', '--stdin', '--stdin-filename=stdin.js'],
+                    input=code.encode('utf-8'),
                     capture_output=True,
-                    text=True,
                     timeout=30
                 )
                 if result.stdout:
-                    eslint_output = json.loads(result.stdout)
+                    # orjson parses the raw bytes directly, skipping the text decode
+                    eslint_output = orjson.loads(result.stdout)
                     for file in eslint_output:
                         for issue in file.get('messages', []):
-                            item = {
-                                'line': issue.get('line', 0),
-                                'column': issue.get('column', 0),
-                                'message': issue.get('message', ''),
-                                'type': issue.get('severity', 1) == 2 and 'error' or 'warning',
-                                'symbol': issue.get('ruleId', '')
-                            }
+                            item = Issue(
+                                line=issue.get('line', 0),
+                                column=issue.get('column', 0),
+                                message=issue.get('message', ''),
+                                type=issue.get('severity', 1) == 2 and 'error' or 'warning',
+                                symbol=issue.get('ruleId', '')
+                            )
                             if issue.get('severity') == 2:
                                 bugs.append(item)
                             else:
                                 warnings.append(item)
                 else:
-                    logging.error(f"ESLint failed with stderr: {result.stderr}")
-                    return {'bugs': [], 'warnings': [], 'suggestions': [], 'error': f'ESLint failed: {result.stderr}'}
+                    stderr = result.stderr.decode('utf-8', errors='replace')
+                    logging.error(f"ESLint failed with stderr: {stderr}")
+                    return _error_result(f'ESLint failed: {stderr}')
             except subprocess.TimeoutExpired:
                 logging.error("ESLint timed out after 30 seconds")
-                return {'bugs': [], 'warnings': [], 'suggestions': [], 'error': 'ESLint analysis timed out'}
+                return _error_result('ESLint analysis timed out')
             except json.JSONDecodeError as e:
                 logging.error(f"ESLint JSON parsing failed: {str(e)}")
-                return {'bugs': [], 'warnings': [], 'suggestions': [], 'error': 'Failed to parse ESLint output'}
+                return _error_result('Failed to parse ESLint output')
             except Exception as e:
                 logging.error(f"ESLint error: {str(e)}")
-                return {'bugs': [], 'warnings': [], 'suggestions': [], 'error': f'ESLint error: {str(e)}'}
-            finally:
-                if temp_file and os.path.exists(temp_file):
-                    try:
-                        os.unlink(temp_file)
-                    except OSError as e:
-                        logging.error(f"Failed to delete temporary file {temp_file}: {str(e)}")
+                return _error_result(f'ESLint error: {str(e)}')
         else:
             # Fallback to regex-based analysis
-            lines = code.split('\n')
-            for i, line in enumerate(lines, 1):
-                if re.search(r'[^;{}]\s*$', line.strip()) and line.strip() and not line.strip().endswith('{') and not line.strip().endswith('}'):
-                    if not re.match(r'^\s*(if|for|while|function|else|try|catch|finally)', line.strip()):
-                        suggestions.append({
-                            'line': i,
-                            'message': 'Consider adding semicolon at end of statement',
-                            'type': 'style'
-                        })
-                if re.search(r'\bvar\s+', line):
-                    suggestions.append({
-                        'line': i,
-                        'message': 'Consider using let or const instead of var',
-                        'type': 'modern'
-                    })
-                if re.search(r'console\.log', line):
-                    warnings.append({
-                        'line': i,
-                        'message': 'Remove console.log statements in production code',
-                        'type': 'warning'
-                    })
-                if re.search(r'==(?!=)', line):
-                    suggestions.append({
-                        'line': i,
-                        'message': 'Use strict equality (===) instead of loose equality (==)',
-                        'type': 'best_practice'
-                    })
-                if re.search(r'function\s*\(\s*\)', line):
-                    suggestions.append({
-                        'line': i,
-                        'message': 'Consider using arrow functions for better readability',
-                        'type': 'modern'
-                    })
-
-        return {
-            'bugs': bugs,
-            'warnings': warnings,
-            'suggestions': suggestions,
-            'summary': f'Found {len(bugs)} bugs, {len(warnings)} warnings, {len(suggestions)} suggestions'
-        }
\ No newline at end of file
+            buckets = {'warnings': warnings, 'suggestions': suggestions}
+            for i, findings in enumerate(self._scan_javascript(code), 1):
+                for kind in findings:
+                    bucket, message, issue_type = _JS_FINDINGS[kind]
+                    buckets[bucket].append(Issue(line=i, message=message, type=issue_type))
+
+        return _analysis_result(bugs, warnings, suggestions)
+
+    @staticmethod
+    def _scan_javascript(text: str) -> List[Tuple[str, ...]]:
+        """Return, for each line of text, the names of the fallback checks that fire on it, in report order"""
+        hits: Dict[int, set] = {}
+        line_starts = None
+        for kind, trigger, pattern in _JS_PATTERNS:
+            # A substring check is far cheaper than the regex scan, so skip it when nothing can match
+            if trigger not in text:
+                continue
+            if line_starts is None:
+                line_starts = [0] + [match.end() for match in _NEWLINE.finditer(text)]
+            # Scan the joined lines once, mapping matches back to line indexes via the line start offsets
+            for match in pattern.finditer(text):
+                hits.setdefault(bisect.bisect_right(line_starts, match.start()) - 1, set()).add(kind)
+
+        findings = []
+        for index, line in enumerate(text.split('\n')):
+            stripped = line.strip()
+            if not stripped:
+                findings.append(())
+                continue
+            kinds = []
+            if stripped[-1] not in ';{}' and not stripped.startswith(_JS_BLOCK_KEYWORDS):
+                kinds.append('missing_semicolon')
+            line_hits = hits.get(index)
+            if line_hits:
+                kinds.extend(kind for kind in _JS_FINDINGS if kind in line_hits)
+            findings.append(tuple(kinds))
+        return findings
+
+class AnalysisBatcher:
+    """Coalesce concurrent analyze requests into batched CodeAnalyzer.analyze_many calls"""
+
+    def __init__(self, analyzer: CodeAnalyzer, max_batch: int = 16, window: float = 0.02, max_in_flight: int = 4):
+        self.analyzer = analyzer
+        self.max_batch = max_batch
+        self.window = window
+        self._queue: queue.Queue = queue.Queue()
+        # Batches are handed off so a slow linter run doesn't hold up the next batch
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='analysis-batch')
+        self._worker = threading.Thread(target=self._run, name='analysis-batcher', daemon=True)
+        self._worker.start()
+
+    def analyze(self, code: str, language: str) -> Dict[str, Any]:
+        """Analyze one snippet; only uncached Python code waits for a batch"""
+        if language.lower() != 'python':
+            # ESLint and the regex fallback gain nothing from batching
+            return self.analyzer.analyze(code, language)
+        return self.submit(code, language).result()
+
+    def submit(self, code: str, language: str) -> Future:
+        """Queue a snippet for analysis; the future resolves to the analyze() result
+
+        A cached result resolves the future right away, without waiting for a batch.
+        """
+        future: Future = Future()
+        cached = self.analyzer.cached_result(code, language)
+        if cached is not None:
+            future.set_result(cached)
+        else:
+            self._queue.put((code, language, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._executor.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch: List[Tuple[str, str, Future]]) -> None:
+        try:
+            # submit() already recorded each lookup, so the re-check in analyze_many mustn't count again
+            results = self.analyzer.analyze_many([(code, language) for code, language, _ in batch], record_lookups=False)
+        except Exception as e:
+            logging.error(f"Batch analysis failed: {str(e)}")
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
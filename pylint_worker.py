@@ -0,0 +1,72 @@
+"""Long-lived pylint worker.
+
+Reads length-prefixed JSON requests ({"filename": ..., "code": ...}) from stdin,
+lints each snippet in-process with pylint.lint.Run and writes back a
+length-prefixed response: pylint's JSON message array, or {"error": ...}.
+Keeping one process alive avoids re-importing pylint and astroid per request.
+"""
+import contextlib
+import io
+import struct
+import sys
+from typing import BinaryIO, Optional
+
+import orjson
+
+_HEADER = struct.Struct('>I')
+
+
+def read_frame(stream: BinaryIO) -> Optional[bytes]:
+    """Read one length-prefixed frame, or None if the stream is closed"""
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    (length,) = _HEADER.unpack(header)
+    payload = stream.read(length)
+    if len(payload) < length:
+        return None
+    return payload
+
+
+def write_frame(stream: BinaryIO, payload: bytes) -> None:
+    """Write one length-prefixed frame and flush it"""
+    stream.write(_HEADER.pack(len(payload)) + payload)
+    stream.flush()
+
+
+def _lint(filename: str, code: str) -> str:
+    from astroid import MANAGER
+    from pylint.lint import Run
+
+    # pylint --from-stdin reads the module source from sys.stdin
+    sys.stdin = io.TextIOWrapper(io.BytesIO(code.encode('utf-8')), encoding='utf-8')
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            Run(['--output-format=json', '--disable=duplicate-code', '--from-stdin', filename], exit=False)
+    finally:
+        # Don't let the next snippet with the same name see this one's AST
+        MANAGER.astroid_cache.pop(filename.rsplit('.', 1)[0], None)
+    return output.getvalue()
+
+
+def main() -> None:
+    requests = sys.stdin.buffer
+    responses = sys.stdout.buffer
+    # Lint an empty module while idle, so the first real request doesn't pay for pylint's start-up
+    _lint('warmup.py', '')
+    while True:
+        frame = read_frame(requests)
+        if frame is None:
+            break
+        try:
+            request = orjson.loads(frame)
+            # The reporter output is already JSON, so it is passed through unchanged
+            response = _lint(request['filename'], request['code']).encode('utf-8')
+        except (Exception, SystemExit) as e:
+            response = orjson.dumps({'error': str(e)})
+        write_frame(responses, response)
+
+
+if __name__ == '__main__':
+    main()
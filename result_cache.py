@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional
+
+
+class CountMinSketch:
+    """Approximate access counter with periodic halving so old popularity fades"""
+
+    DEPTH = 4
+
+    def __init__(self, width: int, sample_size: int):
+        # Power-of-two width (at most 16 bits) so each row indexes its own slice of one hash
+        self.width = 1 << min(16, max(4, (width - 1).bit_length()))
+        self._mask = self.width - 1
+        self._rows: List[List[int]] = [[0] * self.width for _ in range(self.DEPTH)]
+        self.sample_size = sample_size
+        self._additions = 0
+
+    def increment(self, key: Hashable) -> None:
+        h = hash(key)
+        mask = self._mask
+        for row in self._rows:
+            row[h & mask] += 1
+            h >>= 16
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._reset()
+
+    def estimate(self, key: Hashable) -> int:
+        h = hash(key)
+        mask = self._mask
+        counts = []
+        for row in self._rows:
+            counts.append(row[h & mask])
+            h >>= 16
+        return min(counts)
+
+    def _reset(self) -> None:
+        for row in self._rows:
+            row[:] = [count >> 1 for count in row]
+        self._additions //= 2
+
+
+class TinyLFUCache:
+    """LRU cache that only admits a new key if it is requested at least as often as the LRU victim
+
+    One-off entries then can't flush out entries that are requested over and over.
+    Not thread-safe; callers serialize access.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._sketch = CountMinSketch(width=maxsize * 4, sample_size=maxsize * 10)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def peek(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return key's value (or default) without recording an access"""
+        return self._data.get(key, default)
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Record an access to key and return its value (or default)"""
+        self._sketch.increment(key)
+        if key not in self._data:
+            return default
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        if key in self._data:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            return
+        if len(self._data) >= self.maxsize:
+            victim = next(iter(self._data))
+            if self._sketch.estimate(key) < self._sketch.estimate(victim):
+                return
+            del self._data[victim]
+        self._data[key] = value